@@ -1,31 +1,39 @@
 import time
 import numpy as np
 import matplotlib.pyplot as plt
-from numba import jit, prange, vectorize, float64
+from numba import jit, prange, config
+
+# Number of per-thread partial sums; a compile-time constant, so the
+# parallel kernels stay cacheable (get_num_threads() inside a kernel is not)
+N_THREADS = config.NUMBA_NUM_THREADS
 
 def sum_of_squares(x):
-    s = 0
-    for i in range(len(x)):
-        s += x[i] * x[i]
-    return s
+    return np.dot(x, x)
 
-@jit(nopython=True)
+@jit(nopython=True, cache=True)
 def sum_of_squares_jit(x):
-    s = 0
+    s = 0.0
     for i in range(len(x)):
         s += x[i] * x[i]
     return s
 
-@jit(nopython=True, parallel=True)
+@jit(nopython=True, parallel=True, cache=True)
 def sum_of_squares_parallel(x):
-    s = 0
-    for i in prange(len(x)):
-        s += x[i] * x[i]
-    return s
+    n = len(x)
+    # Each thread sums a contiguous slice into its own slot
+    partials = np.zeros(N_THREADS)
+    for t in prange(N_THREADS):
+        lo = t * n // N_THREADS
+        hi = (t + 1) * n // N_THREADS
+        acc = 0.0
+        for i in range(lo, hi):
+            acc += x[i] * x[i]
+        partials[t] = acc
+    return partials.sum()
 
 Ns = np.linspace(10**4, 10**6, 10, dtype=int)
 
-times_python = []
+times_numpy = []
 times_jit = []
 times_parallel = []
 
@@ -38,24 +46,24 @@ _ = sum_of_squares_parallel(dummy)
 for N in Ns:
     a = np.random.rand(N)
     
-    start = time.time()
-    result_python = sum_of_squares(a.tolist())
-    end = time.time()
-    times_python.append(end - start)
+    start = time.perf_counter()
+    result_numpy = sum_of_squares(a)
+    end = time.perf_counter()
+    times_numpy.append(end - start)
     
-    start = time.time()
+    start = time.perf_counter()
     result_jit = sum_of_squares_jit(a)
-    end = time.time()
+    end = time.perf_counter()
     times_jit.append(end - start)
     
-    start = time.time()
+    start = time.perf_counter()
     result_parallel = sum_of_squares_parallel(a)
-    end = time.time()
+    end = time.perf_counter()
     times_parallel.append(end - start)
 
 
 plt.figure(figsize=(10, 6))
-plt.plot(Ns, times_python, marker="o", label="Czysty Python")
+plt.plot(Ns, times_numpy, marker="o", label="NumPy (np.dot)")
 plt.plot(Ns, times_jit, marker="s", label="Numba (nopython=True)")
 plt.plot(Ns, times_parallel, marker="^", label="Numba (parallel=True)")
 plt.xlabel("Rozmiar wektora N")
@@ -70,25 +78,30 @@ def sum_matrix_seq(m):
     s = 0.0
     rows, cols = m.shape
     for i in range(rows):
+        row = m[i]
+        acc = 0.0
         for j in range(cols):
-            s += m[i, j] * m[i, j]
+            acc += row[j] * row[j]
+        s += acc
     return s
 
-@jit(nopython=True, parallel=True)
+@jit(nopython=True, parallel=True, cache=True)
 def sum_matrix_parallel(m):
-    s = 0.0
-    n = m.shape[0]
-    for i in prange(n):
-        for j in range(n):
-            s += m[i, j] * m[i, j]
-    return s
-
-@vectorize([float64(float64)])
-def square(x):
-    return x * x
+    rows, cols = m.shape
+    # Each thread handles a contiguous block of rows
+    partials = np.zeros(N_THREADS)
+    for t in prange(N_THREADS):
+        lo = t * rows // N_THREADS
+        hi = (t + 1) * rows // N_THREADS
+        for i in range(lo, hi):
+            acc = 0.0
+            for j in range(cols):
+                acc += m[i, j] * m[i, j]
+            partials[t] += acc
+    return partials.sum()
 
 def sum_matrix_vectorized(m):
-    return np.sum(square(m))
+    return np.einsum('ij,ij->', m, m)
 
 sizes = [1000, 2000, 3000, 4000]
 
@@ -106,25 +119,25 @@ for N in sizes:
     print("Testujemy macierz o rozmiarze {}x{}".format(N, N))
     m = np.random.rand(N, N)
 
-    start = time.time()
+    start = time.perf_counter()
     result_seq = sum_matrix_seq(m)
-    end = time.time()
+    end = time.perf_counter()
     times_seq.append(end - start)
     
-    start = time.time()
+    start = time.perf_counter()
     result_parallel = sum_matrix_parallel(m)
-    end = time.time()
+    end = time.perf_counter()
     times_parallel.append(end - start)
     
-    start = time.time()
+    start = time.perf_counter()
     result_vectorized = sum_matrix_vectorized(m)
-    end = time.time()
+    end = time.perf_counter()
     times_vectorized.append(end - start)
 
 plt.figure(figsize=(10, 6))
 plt.plot(sizes, times_seq, marker="o", label="Sekwencyjne (czysty Python)")
 plt.plot(sizes, times_parallel, marker="s", label="Numba równoległy (@jit, prange)")
-plt.plot(sizes, times_vectorized, marker="^", label="Numba vectorize")
+plt.plot(sizes, times_vectorized, marker="^", label="NumPy einsum")
 plt.xlabel("Rozmiar macierzy NxN (N)")
 plt.ylabel("Czas wykonania [s]")
 plt.title("Porównanie czasu wykonania sumowania kwadratów macierzy")
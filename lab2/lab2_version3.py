@@ -7,45 +7,33 @@ def create_sierpinski_carpet(n):
     Sekwencyjne generowanie dywanu Sierpińskiego.
 
     @param n {int} - poziom rekurencji (głębokość fraktala)
-    @return {numpy.ndarray} - macierz reprezentująca dywan Sierpińskiego
+    @return {numpy.ndarray} - macierz logiczna (bool) reprezentująca dywan Sierpińskiego
     """
     # Obliczenie rozmiaru macierzy (3^n x 3^n)
     size = 3 ** n
 
-    # Inicjalizacja macierzy jedynkami
-    carpet = np.ones((size, size), dtype=np.uint8)
-
-    # Rekurencyjne usuwanie środkowych kwadratów
-    def remove_center(x0, y0, size):
-        """
-        Rekurencyjnie usuwa środkowe kwadraty z dywanu.
-
-        @param x0 {int} - początkowa współrzędna x
-        @param y0 {int} - początkowa współrzędna y
-        @param size {int} - rozmiar bieżącego kwadratu
-        """
-        # Warunek końcowy rekurencji
-        if size < 3:
-            return
-
-        # Obliczenie nowego rozmiaru
-        new_size = size // 3
-
-        # Usunięcie środkowego kwadratu
-        for i in range(x0 + new_size, x0 + 2*new_size):
-            for j in range(y0 + new_size, y0 + 2*new_size):
-                carpet[i, j] = 0
-
-        # Rekurencyjne wywołanie dla 8 pozostałych kwadratów
-        if new_size < 3:
-            return
-        for i in range(3):
-            for j in range(3):
-                if not (i == 1 and j == 1):
-                    remove_center(x0 + i * new_size, y0 + j * new_size, new_size)
-
-    # Rozpoczęcie rekurencji od całej macierzy
-    remove_center(0, 0, size)
+    # Dywan jest symetryczny względem obu osi (odbicie zamienia cyfrę
+    # trójkową d na 2-d, więc jedynki zostają na miejscu) - wystarczy
+    # wyznaczyć lewą górną ćwiartkę
+    half = (size + 1) // 2
+
+    # Tablica potęg 3^k i cyfry trójkowe wszystkich indeksów ćwiartki:
+    # middle[i, k] mówi, czy k-ta cyfra indeksu i jest równa 1
+    pows = 3 ** np.arange(n, dtype=np.int64)
+    middle = (np.arange(half, dtype=np.int64)[:, None] // pows) % 3 == 1
+
+    # Punkt jest dziurą, jeśli na którejś pozycji obie cyfry w systemie
+    # trójkowym są równe 1
+    hole = np.zeros((half, half), dtype=bool)
+    for k in range(n):
+        hole |= middle[:, k, None] & middle[None, :, k]
+    quad = ~hole
+
+    # Złożenie całego dywanu z odbić ćwiartki
+    carpet = np.empty((size, size), dtype=bool)
+    carpet[:half, :half] = quad
+    carpet[:half, half:] = quad[:, :size - half][:, ::-1]
+    carpet[half:, :] = carpet[:size - half][::-1]
 
     return carpet
 
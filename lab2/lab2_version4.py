@@ -1,57 +1,78 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import time
-from numba import njit, prange
+from numba import njit, prange, config
 
-@njit
+# Liczba bloków wierszy w wersji równoległej (stała kompilacji, zgodna z cache=True)
+N_THREADS = config.NUMBA_NUM_THREADS
+
+@njit(cache=True)
+def middle_digit_bits(n):
+    """
+    Maska bitowa pozycji, na których cyfra indeksu w systemie trójkowym jest równa 1.
+
+    @param n {int} - poziom rekurencji (liczba cyfr trójkowych)
+    @return {numpy.ndarray} - wektor długości 3^n, bit k ustawiony gdy k-ta cyfra to 1
+    """
+    size = 3 ** n
+    bits = np.empty(size, dtype=np.int64)
+
+    for i in range(size):
+        x = i
+        b = 0
+        for k in range(n):
+            if x % 3 == 1:
+                b |= 1 << k
+            x //= 3
+        bits[i] = b
+
+    return bits
+
+@njit(cache=True)
 def create_sierpinski_carpet_sequential(n):
     """
     Sekwencyjne generowanie dywanu Sierpińskiego z optymalizacją Numba.
 
     @param n {int} - poziom rekurencji (głębokość fraktala)
-    @return {numpy.ndarray} - macierz reprezentująca dywan Sierpińskiego
+    @return {numpy.ndarray} - macierz logiczna (bool) reprezentująca dywan Sierpińskiego
     """
     # Obliczenie rozmiaru macierzy (3^n x 3^n)
     size = 3 ** n
 
-    # Inicjalizacja macierzy jedynkami
-    carpet = np.ones((size, size), dtype=np.uint8)
+    # Każdy element jest nadpisywany w pętli, więc bez wstępnego wypełnienia
+    carpet = np.empty((size, size), dtype=np.bool_)
 
-    # Iteracyjne sprawdzanie każdego punktu
+    # Punkt jest dziurą, gdy maski wiersza i kolumny mają wspólny bit
+    bits = middle_digit_bits(n)
     for i in range(size):
+        row_bits = bits[i]
         for j in range(size):
-            x, y = i, j
-            for k in range(n):
-                if (x % 3 == 1) and (y % 3 == 1):
-                    carpet[i, j] = 0
-                    break
-                x //= 3
-                y //= 3
+            carpet[i, j] = (row_bits & bits[j]) == 0
 
     return carpet
 
 # Wersja równoległa z Numba
-@njit(parallel=True)
+@njit(parallel=True, cache=True)
 def create_sierpinski_carpet_parallel(n):
     """
     Równoległe generowanie dywanu Sierpińskiego z optymalizacją Numba.
 
     @param n {int} - poziom rekurencji (głębokość fraktala)
-    @return {numpy.ndarray} - macierz reprezentująca dywan Sierpińskiego
+    @return {numpy.ndarray} - macierz logiczna (bool) reprezentująca dywan Sierpińskiego
     """
     size = 3 ** n
 
-    carpet = np.ones((size, size), dtype=np.uint8)
+    carpet = np.empty((size, size), dtype=np.bool_)
 
-    for i in prange(size):  # Stały krok = 1
-        for j in range(size):
-            x, y = i, j
-            for k in range(n):
-                if (x % 3 == 1) and (y % 3 == 1):
-                    carpet[i, j] = 0
-                    break
-                x //= 3
-                y //= 3
+    bits = middle_digit_bits(n)
+    # Każdy wątek wypełnia ciągły blok wierszy
+    for t in prange(N_THREADS):
+        lo = t * size // N_THREADS
+        hi = (t + 1) * size // N_THREADS
+        for i in range(lo, hi):
+            row_bits = bits[i]
+            for j in range(size):
+                carpet[i, j] = (row_bits & bits[j]) == 0
 
     return carpet
 
@@ -75,48 +96,49 @@ def benchmark_comparison(n_values):
     Porównanie wydajności implementacji sekwencyjnej i równoległej.
 
     @param n_values {list} - lista poziomów rekurencji do przetestowania
-    @return {tuple} - krotka (czasy_sekwencyjne, czasy_równoległe)
+    @return {tuple} - krotka (czasy_sekwencyjne, czasy_równoległe, dywany)
     """
-    sequential_times = []
-    parallel_times = []
+    sequential_times = np.empty(len(n_values))
+    parallel_times = np.empty(len(n_values))
+    carpets = []
 
     # Rozgrzewka Numba
     _ = create_sierpinski_carpet_sequential(2)
     _ = create_sierpinski_carpet_parallel(2)
 
-    for n in n_values:
+    for idx, n in enumerate(n_values):
         print(f"Testowanie dla n={n}...")
 
         start_time = time.time()
         carpet_seq = create_sierpinski_carpet_sequential(n)
         seq_time = time.time() - start_time
-        sequential_times.append(seq_time)
+        sequential_times[idx] = seq_time
         print(f"  Sekwencyjnie z Numba: {seq_time:.4f}s")
 
         start_time = time.time()
         carpet_par = create_sierpinski_carpet_parallel(n)
         par_time = time.time() - start_time
-        parallel_times.append(par_time)
+        parallel_times[idx] = par_time
         print(f"  Równolegle z Numba:   {par_time:.4f}s")
 
         if not np.array_equal(carpet_seq, carpet_par):
             print("  UWAGA: Wyniki implementacji sekwencyjnej i równoległej różnią się!")
 
-        plot_carpet(carpet_seq, f"Dywan Sierpinskiego n={n}")
+        carpets.append(carpet_seq)
 
         speedup = seq_time / par_time if par_time > 0 else 0
         print(f"  Przyspieszenie: {speedup:.2f}x")
         print()
 
-    return sequential_times, parallel_times
+    return sequential_times, parallel_times, carpets
 
 def plot_comparison(n_values, sequential_times, parallel_times):
     """
     Rysuje wykres porównujący wydajność implementacji sekwencyjnej i równoległej.
 
     @param n_values {list} - lista poziomów rekurencji
-    @param sequential_times {list} - czasy wykonania dla implementacji sekwencyjnej
-    @param parallel_times {list} - czasy wykonania dla implementacji równoległej
+    @param sequential_times {numpy.ndarray} - czasy wykonania dla implementacji sekwencyjnej
+    @param parallel_times {numpy.ndarray} - czasy wykonania dla implementacji równoległej
     """
     plt.figure(figsize=(10, 6))
 
@@ -160,7 +182,11 @@ def main():
 
     n_values = [3, 4, 5]
     print("Porównanie wydajności implementacji sekwencyjnej i równoległej:")
-    sequential_times, parallel_times = benchmark_comparison(n_values)
+    sequential_times, parallel_times, carpets = benchmark_comparison(n_values)
+
+    # Wizualizacja poza pomiarami, aby zapis plików nie wpływał na wyniki
+    for n, carpet in zip(n_values, carpets):
+        plot_carpet(carpet, f"Dywan Sierpinskiego n={n}")
 
     plot_comparison(n_values, sequential_times, parallel_times)
 
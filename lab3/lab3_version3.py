@@ -1,17 +1,132 @@
 import random
 import time
-from typing import List, Tuple, Optional, Dict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable, List, Tuple, Optional
 import matplotlib.pyplot as plt
 import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def _generate_core(maze: np.ndarray, width: int, height: int, dirs: np.ndarray, seed: int) -> None:
+    """
+    Carve passages into a wall-filled maze with an iterative Depth-First Search.
+
+    @param maze: int8 grid filled with walls, modified in place
+    @param width: Width of the maze
+    @param height: Height of the maze
+    @param dirs: Unit steps (dx, dy); the generator moves two cells at a time
+    @param seed: Seed for the random direction order
+    """
+    np.random.seed(seed)
+
+    # Explicit stack of cells kept as two coordinate arrays; every cell is
+    # pushed at most once
+    stack_x = np.empty(height * width, np.int32)
+    stack_y = np.empty_like(stack_x)
+    maze[1, 1] = 0
+    stack_x[0] = 1
+    stack_y[0] = 1
+    top = 1
+
+    while top > 0:
+        current_x = stack_x[top - 1]
+        current_y = stack_y[top - 1]
+
+        moved = False
+        for d in np.random.permutation(4):
+            dx = dirs[d, 0]
+            dy = dirs[d, 1]
+            nx, ny = current_x + 2 * dx, current_y + 2 * dy
+            if 0 < nx < height - 1 and 0 < ny < width - 1 and maze[nx, ny] == -1:
+                maze[current_x + dx, current_y + dy] = 0
+                maze[nx, ny] = 0
+
+                stack_x[top] = nx
+                stack_y[top] = ny
+                top += 1
+                moved = True
+                break
+
+        if not moved:
+            top -= 1
+
+@njit(cache=True)
+def _solve_core(maze: np.ndarray, dirs: np.ndarray, start: int, end: int) -> np.ndarray:
+    """
+    Breadth-first search over the maze with cells encoded as p = x * width + y.
+    Visited cells are marked with 2 and the found path with 3.
+
+    @param maze: int8 grid, modified in place
+    @param dirs: Unit steps (dx, dy) to the neighbouring cells
+    @param start: Encoded start position
+    @param end: Encoded end position
+    @return: Encoded positions of the path from start to end
+    """
+    height, width = maze.shape
+    cells = maze.reshape(height * width)
+
+    # BFS to find path; parent[p] == -1 means not visited yet
+    parent = np.full(height * width, -1, dtype=np.int32)
+    queue = np.empty(height * width, dtype=np.int32)
+    parent[start] = start
+    queue[0] = start
+    head, tail = 0, 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+
+        if current == end:
+            break
+
+        x = current // width
+        y = current % width
+        for d in range(dirs.shape[0]):
+            nx, ny = x + dirs[d, 0], y + dirs[d, 1]
+            if not (0 <= nx < height and 0 <= ny < width):
+                continue
+
+            q = nx * width + ny
+            if cells[q] == 0 and parent[q] == -1:
+                queue[tail] = q
+                tail += 1
+                parent[q] = current
+                # Mark as visited
+                cells[q] = 2
+
+    # Reconstruct the path, walking back from the end
+    if parent[end] == -1:
+        return np.array([end], dtype=np.int32)
+
+    length = 1
+    p = end
+    while p != start:
+        p = parent[p]
+        length += 1
+
+    path = np.empty(length, dtype=np.int32)
+    p = end
+    for k in range(length - 1, -1, -1):
+        path[k] = p
+        # Mark the path with a different value
+        if p != start and p != end:
+            cells[p] = 3
+        p = parent[p]
+
+    return path
 
 class Maze:
     """
     Class representing a maze with methods for generation and solving.
-    The maze is represented as a 2D array where:
+    The maze is represented as a 2D int8 NumPy array where:
     -1 = wall
     0 = passage
     1+ = visited by a specific thread
     """
+    # Neighbour steps (dx, dy) shared by the generator and the solver
+    _DIRS = np.array([(0, 1), (1, 0), (0, -1), (-1, 0)], dtype=np.int8)
+
     def __init__(self, width: int, height: int):
         """
         Initialize a new maze with the given dimensions.
@@ -21,53 +136,28 @@ class Maze:
         """
         self.width = width
         self.height = height
-        self.maze = [[-1 for _ in range(width)] for _ in range(height)]
+        self.maze = np.full((height, width), -1, dtype=np.int8)
         self.start_pos: Tuple[int, int] = (0, 0)
         self.end_pos: Tuple[int, int] = (height - 1, width - 1)
 
-    def generate_maze(self) -> None:
+    def generate_maze(self, seed: Optional[int] = None) -> None:
         """
         Generate a random maze using Depth-First Search algorithm.
         This ensures that every cell in the maze is reachable.
-        """
-        for i in range(self.height):
-            for j in range(self.width):
-                self.maze[i][j] = -1
-
-        start_x, start_y = 1, 1
-        self.maze[start_x][start_y] = 0
 
-        stack: List[Tuple[int, int]] = [(start_x, start_y)]
-
-        directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-
-        while stack:
-            current_x, current_y = stack[-1]
-
-            neighbors = []
-            random.shuffle(directions)
-
-            for dx, dy in directions:
-                nx, ny = current_x + dx, current_y + dy
-                if 0 < nx < self.height - 1 and 0 < ny < self.width - 1 and self.maze[nx][ny] == -1:
-                    neighbors.append((nx, ny, dx // 2, dy // 2))
-
-            if neighbors:
-                next_x, next_y, wall_x, wall_y = neighbors[0]
-
-                self.maze[current_x + wall_x][current_y + wall_y] = 0
-
-                self.maze[next_x][next_y] = 0
+        @param seed: Seed for the random generator, drawn at random if omitted
+        """
+        if seed is None:
+            seed = random.randrange(2**32)
 
-                stack.append((next_x, next_y))
-            else:
-                stack.pop()
+        self.maze.fill(-1)
+        _generate_core(self.maze, self.width, self.height, self._DIRS, seed)
 
         # Create entrance and exit
         self.start_pos = (0, 1)
         self.end_pos = (self.height - 1, self.width - 2)
-        self.maze[self.start_pos[0]][self.start_pos[1]] = 0
-        self.maze[self.end_pos[0]][self.end_pos[1]] = 0
+        self.maze[self.start_pos] = 0
+        self.maze[self.end_pos] = 0
 
     def solve_sequential(self) -> List[Tuple[int, int]]:
         """
@@ -75,44 +165,11 @@ class Maze:
 
         @return: List of coordinates representing the path from start to end
         """
-        # BFS to find path
-        queue: List[Tuple[int, int]] = [self.start_pos]
-        visited: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {self.start_pos: None}
-
-        while queue:
-            current = queue.pop(0)
-
-            if current == self.end_pos:
-                break
-
-            x, y = current
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            for dx, dy in directions:
-                nx, ny = x + dx, y + dy
-                next_pos: Tuple[int, int] = (nx, ny)
-
-                if (0 <= nx < self.height and 0 <= ny < self.width and
-                    self.maze[nx][ny] == 0 and next_pos not in visited):
-                    queue.append(next_pos)
-                    visited[next_pos] = current
-                    # Mark as visited
-                    self.maze[nx][ny] = 2
-
-        # Reconstruct the path
-        path: List[Tuple[int, int]] = []
-        current = self.end_pos
+        start = self.start_pos[0] * self.width + self.start_pos[1]
+        end = self.end_pos[0] * self.width + self.end_pos[1]
+        path = _solve_core(self.maze, self._DIRS, start, end)
 
-        while current:
-            path.append(current)
-            current = visited.get(current)
-
-        # Mark the path with a different value
-        for x, y in path:
-            if (x, y) != self.start_pos and (x, y) != self.end_pos:
-                self.maze[x][y] = 3
-
-        # Return the path in reverse order
-        return path[::-1]
+        return [divmod(int(p), self.width) for p in path]
 
     def visualize(self, title: str = "Maze") -> None:
         """
@@ -122,19 +179,15 @@ class Maze:
         """
         plt.figure(figsize=(10, 10))
 
-        # Create a colored representation
-        colored_maze = np.zeros((self.height, self.width, 3))
-
-        for i in range(self.height):
-            for j in range(self.width):
-                if self.maze[i][j] == -1:  # Wall
-                    colored_maze[i, j] = [0, 0, 0]  # Black
-                elif self.maze[i][j] == 0:  # Passage
-                    colored_maze[i, j] = [1, 1, 1]  # White
-                elif self.maze[i][j] == 2:  # Visited
-                    colored_maze[i, j] = [0.7, 0.7, 1]  # Light blue
-                elif self.maze[i][j] == 3:  # Path
-                    colored_maze[i, j] = [0, 1, 0]  # Green
+        # Create a colored representation, indexed by cell value + 1
+        palette = np.array([
+            [0, 0, 0],      # -1: Wall - Black
+            [1, 1, 1],      #  0: Passage - White
+            [0, 0, 0],      #  1: Unused - Black
+            [0.7, 0.7, 1],  #  2: Visited - Light blue
+            [0, 1, 0],      #  3: Path - Green
+        ], dtype=np.float32)
+        colored_maze = palette[(self.maze + 1).astype(np.intp)]
 
         # Mark start and end
         colored_maze[self.start_pos] = [1, 0, 0]  # Red
@@ -145,6 +198,46 @@ class Maze:
         plt.axis('off')
         plt.show()
 
+def warm_up() -> None:
+    """
+    Compile (or load from cache) the jitted kernels on a small maze,
+    so that later measurements do not include compilation time.
+    """
+    warmup = Maze(5, 5)
+    warmup.generate_maze()
+    warmup.solve_sequential()
+
+def solve_one(seed: int, width: int, height: int) -> Tuple[float, int]:
+    """
+    Generate and solve a single maze; a self-contained task for the sweep benchmark.
+
+    @param seed: Seed used to generate the maze
+    @param width: Width of the maze
+    @param height: Height of the maze
+    @return: Tuple of (solving time in seconds, path length)
+    """
+    maze = Maze(width, height)
+    maze.generate_maze(seed)
+
+    start_time = time.time()
+    path = maze.solve_sequential()
+    end_time = time.time()
+
+    return end_time - start_time, len(path)
+
+def benchmark_sweep(seeds: Iterable[int], width: int, height: int) -> List[Tuple[float, int]]:
+    """
+    Generate and solve independent mazes in parallel worker processes.
+    Each worker builds its own Maze, so no state is shared between processes.
+
+    @param seeds: Seeds of the mazes to generate, one task per seed
+    @param width: Width of every maze
+    @param height: Height of every maze
+    @return: List of (solving time in seconds, path length), in seed order
+    """
+    with ProcessPoolExecutor(initializer=warm_up) as executor:
+        return list(executor.map(solve_one, seeds, repeat(width), repeat(height)))
+
 def main():
     """
     Main function to demonstrate maze generation and solving.
@@ -159,6 +252,9 @@ def main():
     # Visualize initial maze
     maze.visualize("Generated Maze")
 
+    # Warm-up for JIT compilation to avoid measuring compilation time
+    warm_up()
+
     # Solve maze and measure time
     start_time = time.time()
     path = maze.solve_sequential()
@@ -170,5 +266,18 @@ def main():
     print(f"Sequential solving time: {end_time - start_time:.4f} seconds")
     print(f"Path length: {len(path)}")
 
+    # Sweep benchmark: independent mazes solved in parallel processes
+    seeds = range(8)
+    sweep_width, sweep_height = 201, 201
+
+    start_time = time.time()
+    results = benchmark_sweep(seeds, sweep_width, sweep_height)
+    end_time = time.time()
+
+    solve_times = [solve_time for solve_time, _ in results]
+    print(f"\nSweep of {len(results)} mazes ({sweep_width}x{sweep_height}): "
+          f"{end_time - start_time:.4f} seconds total, "
+          f"mean solving time {sum(solve_times) / len(solve_times):.4f} seconds")
+
 if __name__ == "__main__":
     main()